@@ -8,37 +8,21 @@ Usage:
     python -m testing.cli check-imports --skill langgraph
 """
 
+import argparse
+import os
 import sys
 from pathlib import Path
 
-try:
-    import click
-except ImportError:
-    print("Please install click: pip install click")
-    sys.exit(1)
-
-from .validator import SkillValidator, format_result
-from .imports import validate_imports, format_import_issues
-
 
 # Find skills directory relative to this file
 TESTING_DIR = Path(__file__).parent
 ROOT_DIR = TESTING_DIR.parent
 SKILLS_DIR = ROOT_DIR / "skills"
 
+VERSION = "1.0.0"
 
-@click.group()
-@click.version_option(version="1.0.0")
-def cli():
-    """Skill correctness validation CLI."""
-    pass
 
-
-@cli.command()
-@click.option("--skill", help="Skill to validate (e.g., langgraph)")
-@click.option("--all", "validate_all", is_flag=True, help="Validate all skills")
-@click.option("--strict", is_flag=True, help="Treat warnings as errors")
-def validate(skill, validate_all, strict):
+def _validate(skill, validate_all, strict, jobs=None):
     """Validate skill content for correctness.
 
     Checks:
@@ -47,19 +31,21 @@ def validate(skill, validate_all, strict):
     - Deprecated APIs
     - Missing critical sections
     """
+    from .validator import SEP60, SkillValidator, format_result
+
     validator = SkillValidator()
 
     if validate_all:
-        results = validator.validate_all_skills(SKILLS_DIR)
+        results = validator.validate_all_skills(SKILLS_DIR, max_workers=jobs)
     elif skill:
         skill_path = SKILLS_DIR / skill / "SKILL.md"
         if not skill_path.exists():
-            click.echo(f"Skill not found: {skill}", err=True)
-            click.echo(f"Available skills: {', '.join(s.name for s in SKILLS_DIR.iterdir() if s.is_dir())}")
+            print(f"Skill not found: {skill}", file=sys.stderr)
+            print(f"Available skills: {', '.join(e.name for e in os.scandir(SKILLS_DIR) if e.is_dir())}")
             sys.exit(1)
         results = [validator.validate_skill(skill_path)]
     else:
-        click.echo("Specify --skill NAME or --all", err=True)
+        print("Specify --skill NAME or --all", file=sys.stderr)
         sys.exit(1)
 
     # Print results
@@ -67,89 +53,102 @@ def validate(skill, validate_all, strict):
     total_warnings = 0
 
     for result in results:
-        click.echo(format_result(result))
+        print(format_result(result))
         total_errors += result.error_count
         total_warnings += result.warning_count
 
     # Summary
-    click.echo(f"\n{'='*60}")
-    click.echo("SUMMARY")
-    click.echo(f"{'='*60}")
-    click.echo(f"Skills checked: {len(results)}")
-    click.echo(f"Errors: {total_errors}")
-    click.echo(f"Warnings: {total_warnings}")
+    print("\n".join([
+        f"\n{SEP60}",
+        "SUMMARY",
+        SEP60,
+        f"Skills checked: {len(results)}",
+        f"Errors: {total_errors}",
+        f"Warnings: {total_warnings}",
+    ]))
 
     # Exit code
     if total_errors > 0:
-        click.echo("\nFAILED - fix errors above")
+        print("\nFAILED - fix errors above")
         sys.exit(1)
     elif strict and total_warnings > 0:
-        click.echo("\nFAILED (strict mode) - fix warnings above")
+        print("\nFAILED (strict mode) - fix warnings above")
         sys.exit(1)
     else:
-        click.echo("\nPASSED")
+        print("\nPASSED")
 
 
-@cli.command("check-imports")
-@click.option("--skill", required=True, help="Skill to check")
-def check_imports(skill):
+def _check_imports(skill):
     """Check import statements in skill code blocks.
 
     Validates that imports reference current LangChain/LangGraph modules.
     """
+    import re
+
+    from .imports import validate_imports, format_import_issues
+
     skill_path = SKILLS_DIR / skill / "SKILL.md"
     if not skill_path.exists():
-        click.echo(f"Skill not found: {skill}", err=True)
+        print(f"Skill not found: {skill}", file=sys.stderr)
         sys.exit(1)
 
-    content = skill_path.read_text()
+    content = skill_path.read_text(encoding="utf-8")
 
-    # Extract code blocks
-    import re
-    code_blocks = re.findall(r"```(?:python|py)?\n(.*?)```", content, re.DOTALL)
+    # Stream code blocks, keeping only the blocks that have issues
+    code_block_re = re.compile(r"```(?:python|py)?\n(.*?)```", re.DOTALL)
+    block_count = 0
+    block_issues = []
+    for block_count, m in enumerate(code_block_re.finditer(content), 1):
+        issues = validate_imports(m.group(1))
+        if issues:
+            block_issues.append((block_count, issues))
 
-    click.echo(f"Checking imports in {skill}...")
-    click.echo(f"Found {len(code_blocks)} code blocks\n")
+    out = [
+        f"Checking imports in {skill}...",
+        f"Found {block_count} code blocks\n",
+    ]
 
     all_issues = []
-    for i, code in enumerate(code_blocks, 1):
-        issues = validate_imports(code)
-        if issues:
-            click.echo(f"Block {i}:")
-            click.echo(format_import_issues(issues))
-            click.echo()
-            all_issues.extend(issues)
+    for i, issues in block_issues:
+        out.append(f"Block {i}:")
+        out.append(format_import_issues(issues))
+        out.append("")
+        all_issues.extend(issues)
 
     if not all_issues:
-        click.echo("No import issues found!")
+        out.append("No import issues found!")
     else:
-        click.echo(f"\nTotal: {len(all_issues)} import issues")
+        out.append(f"\nTotal: {len(all_issues)} import issues")
 
+    print("\n".join(out))
 
-@cli.command("list-rules")
-def list_rules():
+
+def _list_rules():
     """List all validation rules."""
+    from .validator import SEP60, SkillValidator
+
     validator = SkillValidator()
 
-    click.echo("Validation Rules")
-    click.echo("=" * 60)
+    out = ["Validation Rules", SEP60]
 
     for rule in validator.rules:
         level = "ERROR" if rule["level"] == "error" else "WARN"
-        click.echo(f"\n[{level}] {rule['id']}")
-        click.echo(f"  {rule['message']}")
+        out.append(f"\n[{level}] {rule['id']}")
+        out.append(f"  {rule['message']}")
         if rule.get("suggestion"):
-            click.echo(f"  Fix: {rule['suggestion']}")
+            out.append(f"  Fix: {rule['suggestion']}")
 
+    print("\n".join(out))
 
-@cli.command("quick")
-def quick():
+
+def _quick(jobs=None):
     """Quick validation of all skills - just show pass/fail."""
+    from .validator import SEP40, SkillValidator
+
     validator = SkillValidator()
-    results = validator.validate_all_skills(SKILLS_DIR)
+    results = validator.validate_all_skills(SKILLS_DIR, max_workers=jobs)
 
-    click.echo("Quick Validation")
-    click.echo("=" * 40)
+    out = ["Quick Validation", SEP40]
 
     all_passed = True
     for result in results:
@@ -161,22 +160,84 @@ def quick():
         elif result.warning_count:
             details = f" ({result.warning_count} warnings)"
 
-        click.echo(f"  {icon} {result.skill_name}: {status}{details}")
+        out.append(f"  {icon} {result.skill_name}: {status}{details}")
 
         if not result.passed:
             all_passed = False
 
-    click.echo()
+    out.append("")
     if all_passed:
-        click.echo("All skills passed!")
+        out.append("All skills passed!")
     else:
-        click.echo("Some skills have errors. Run 'validate --all' for details.")
+        out.append("Some skills have errors. Run 'validate --all' for details.")
+    print("\n".join(out))
+
+    if not all_passed:
         sys.exit(1)
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m testing.cli",
+        description="Skill correctness validation CLI.",
+    )
+    parser.add_argument("--version", "-v", action="version", version=f"%(prog)s, version {VERSION}")
+    subparsers = parser.add_subparsers(dest="cmd", metavar="COMMAND")
+
+    validate = subparsers.add_parser(
+        "validate",
+        help="Validate skill content for correctness.",
+        description=(
+            "Validate skill content for correctness.\n"
+            "\n"
+            "Checks:\n"
+            "- Python syntax in code blocks\n"
+            "- Known anti-patterns (Pydantic for state, etc.)\n"
+            "- Deprecated APIs\n"
+            "- Missing critical sections"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    validate.add_argument("--skill", help="Skill to validate (e.g., langgraph)")
+    validate.add_argument("--all", dest="validate_all", action="store_true", help="Validate all skills")
+    validate.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    validate.add_argument("--jobs", type=int, metavar="N", help="Validate --all across N worker processes")
+
+    check_imports = subparsers.add_parser(
+        "check-imports",
+        help="Check import statements in skill code blocks.",
+        description=(
+            "Check import statements in skill code blocks.\n"
+            "\n"
+            "Validates that imports reference current LangChain/LangGraph modules."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    check_imports.add_argument("--skill", required=True, help="Skill to check")
+
+    subparsers.add_parser("list-rules", help="List all validation rules.")
+    quick = subparsers.add_parser("quick", help="Quick validation of all skills - just show pass/fail.")
+    quick.add_argument("--jobs", type=int, metavar="N", help="Validate across N worker processes")
+
+    return parser
+
+
+def main(argv=None):
     """Entry point."""
-    cli()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.cmd == "validate":
+        _validate(args.skill, args.validate_all, args.strict, args.jobs)
+    elif args.cmd == "check-imports":
+        _check_imports(args.skill)
+    elif args.cmd == "list-rules":
+        _list_rules()
+    elif args.cmd == "quick":
+        _quick(args.jobs)
+    else:
+        parser.print_help()
 
 
 if __name__ == "__main__":
@@ -59,6 +59,26 @@ DEPRECATED_IMPORTS = {
     "langchain.memory": "Use LangGraph checkpointers instead",
 }
 
+# Lookup tables derived from the above
+_VALID_SETS = {module: frozenset(items) for module, items in VALID_IMPORTS.items()}
+
+
+def _group_deprecated_by_package() -> dict[str, list[tuple[str, str]]]:
+    """Group deprecated prefixes by root package, keeping DEPRECATED_IMPORTS order."""
+    grouped: dict[str, list[tuple[str, str]]] = {}
+    for prefix, suggestion in DEPRECATED_IMPORTS.items():
+        grouped.setdefault(prefix.split(".", 1)[0], []).append((prefix, suggestion))
+    return grouped
+
+
+_DEPRECATED_BY_PKG = _group_deprecated_by_package()
+
+# Match: from X import Y, Z
+_FROM_IMPORT_RE = re.compile(r"from\s+([\w.]+)\s+import\s+(.+)")
+
+# Match: import X
+_IMPORT_RE = re.compile(r"^import\s+([\w.]+)", re.MULTILINE)
+
 
 @dataclass
 class ImportIssue:
@@ -78,16 +98,12 @@ def extract_imports(code: str) -> list[tuple[str, list[str]]]:
     """
     imports = []
 
-    # Match: from X import Y, Z
-    from_pattern = r"from\s+([\w.]+)\s+import\s+(.+)"
-    for match in re.finditer(from_pattern, code):
+    for match in _FROM_IMPORT_RE.finditer(code):
         module = match.group(1)
         items = [i.strip().split(" as ")[0] for i in match.group(2).split(",")]
         imports.append((module, items))
 
-    # Match: import X
-    import_pattern = r"^import\s+([\w.]+)"
-    for match in re.finditer(import_pattern, code, re.MULTILINE):
+    for match in _IMPORT_RE.finditer(code):
         module = match.group(1)
         imports.append((module, []))
 
@@ -101,24 +117,25 @@ def validate_imports(code: str) -> list[ImportIssue]:
 
     for module, items in imports:
         # Check for deprecated modules
-        for deprecated, suggestion in DEPRECATED_IMPORTS.items():
-            if module.startswith(deprecated):
-                issues.append(ImportIssue(
-                    import_path=module,
-                    item=None,
-                    message=f"Deprecated import path: {module}",
-                    level="warning",
-                    suggestion=suggestion,
-                ))
-                break
+        candidates = _DEPRECATED_BY_PKG.get(module.split(".", 1)[0], ())
+        suggestion = next((s for deprecated, s in candidates if module.startswith(deprecated)), None)
+        if suggestion is not None:
+            issues.append(ImportIssue(
+                import_path=module,
+                item=None,
+                message=f"Deprecated import path: {module}",
+                level="warning",
+                suggestion=suggestion,
+            ))
 
         # Check if module is in our known valid list
-        if module in VALID_IMPORTS:
+        if module in _VALID_SETS:
+            valid_set = _VALID_SETS[module]
             valid_items = VALID_IMPORTS[module]
             for item in items:
                 # Handle "X as Y" syntax
                 item_name = item.split(" as ")[0].strip()
-                if item_name not in valid_items and item_name != "*":
+                if item_name not in valid_set and item_name != "*":
                     issues.append(ImportIssue(
                         import_path=module,
                         item=item_name,
@@ -8,11 +8,27 @@ Checks skill files for:
 - Deprecated APIs
 """
 
+import os
 import re
 import ast
+import functools
+from collections.abc import Iterator
 from pathlib import Path
 from dataclasses import dataclass, field
 
+# Marks code blocks that intentionally show wrong examples
+_SKIP_RE = re.compile(r"#\s*(WRONG|BAD|DON'T|INCORRECT)", re.IGNORECASE)
+
+# Section separators for formatted output, shared with the CLI
+SEP60 = "=" * 60
+SEP40 = "=" * 40
+
+# Fenced markdown code block: (language, code)
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
+# Code block languages that get a Python syntax check
+_PYTHON_LANGS = ("python", "py", "")
+
 
 @dataclass
 class Issue:
@@ -48,11 +64,75 @@ class ValidationResult:
         return sum(1 for i in self.issues if i.level == "warning")
 
 
+def _extract_code_blocks(content: str) -> Iterator[tuple[str, str, bool]]:
+    """Yield (code, lang, skip) for each code block in markdown content.
+
+    skip is True for blocks intentionally showing wrong examples.
+    """
+    for m in _CODE_BLOCK_RE.finditer(content):
+        code = m.group(2).strip()
+        yield code, m.group(1), bool(_SKIP_RE.search(code))
+
+
+def _syntax_error(code: str) -> SyntaxError | None:
+    """Parse a code block and return its SyntaxError, or None if it is valid."""
+    if _is_trivial_snippet(code):
+        return None
+    try:
+        compile(
+            code,
+            "<block>",
+            "exec",
+            flags=ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT,
+            dont_inherit=True,
+        )
+    except SyntaxError as e:
+        # Drop the traceback so cached errors don't pin parser frames
+        return e.with_traceback(None)
+    return None
+
+
+def _is_trivial_snippet(code: str) -> bool:
+    """True for blocks that are always valid: empty, comments only, or just ``...``."""
+    for line in code.splitlines():
+        # Comment lines may be indented; a bare ... may not
+        if line.rstrip() != "..." and line.strip() and not line.lstrip().startswith("#"):
+            return False
+    return True
+
+
+def _line_number(code: str, match: re.Match) -> int:
+    """1-indexed line of the first non-whitespace character of a match."""
+    text = match.group()
+    start = match.start() + len(text) - len(text.lstrip())
+    return code.count("\n", 0, start) + 1
+
+
+@functools.lru_cache(maxsize=128)
+def _load_skill_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[str, tuple[tuple[str, str, bool], ...], tuple[SyntaxError | None, ...]]:
+    """Read a skill file and syntax-check its code blocks.
+
+    Keyed on mtime and size so an edited file is re-read. Returns
+    (content, code_blocks, syntax_errors); syntax_errors holds None for
+    valid and non-Python blocks.
+    """
+    content = Path(path_str).read_text(encoding="utf-8")
+    code_blocks = tuple(_extract_code_blocks(content))
+    syntax_errors = tuple(
+        _syntax_error(code) if lang in _PYTHON_LANGS else None
+        for code, lang, _ in code_blocks
+    )
+    return content, code_blocks, syntax_errors
+
+
 class SkillValidator:
     """Validates skill content for correctness."""
 
     def __init__(self):
         self.rules = self._load_rules()
+        self._compile_rules()
 
     def _load_rules(self) -> list[dict]:
         """Load validation rules."""
@@ -135,9 +215,21 @@ class SkillValidator:
             },
         ]
 
+    def _compile_rules(self) -> None:
+        """Pre-compile rule patterns so each check is a direct Pattern.search."""
+        for rule in self.rules:
+            rule["_pattern_re"] = re.compile(rule["pattern"], re.MULTILINE)
+            if "negative_pattern" in rule:
+                rule["_negative_re"] = re.compile(rule["negative_pattern"], re.MULTILINE)
+            if "context" in rule:
+                rule["_context_re"] = re.compile(rule["context"], re.IGNORECASE)
+
     def validate_skill(self, skill_path: Path) -> ValidationResult:
         """Validate a single skill file."""
-        content = skill_path.read_text()
+        stat = skill_path.stat()
+        content, code_blocks, syntax_errors = _load_skill_cached(
+            str(skill_path), stat.st_mtime_ns, stat.st_size
+        )
         skill_name = skill_path.parent.name
 
         result = ValidationResult(
@@ -145,19 +237,17 @@ class SkillValidator:
             file_path=skill_path,
         )
 
-        # Extract code blocks
-        code_blocks = self._extract_code_blocks(content)
         result.code_blocks_checked = len(code_blocks)
 
         # Check each code block
-        for i, (code, lang) in enumerate(code_blocks, 1):
+        for i, ((code, lang, skip), error) in enumerate(zip(code_blocks, syntax_errors), 1):
             # Syntax check for Python
-            if lang in ("python", "py", ""):
-                syntax_issues = self._check_syntax(code, i)
+            if lang in _PYTHON_LANGS:
+                syntax_issues = self._check_syntax(error, i)
                 result.issues.extend(syntax_issues)
 
             # Pattern-based rules
-            pattern_issues = self._check_patterns(code, i)
+            pattern_issues = self._check_patterns(code, i, skip)
             result.issues.extend(pattern_issues)
 
         # Check full content for some rules
@@ -166,62 +256,48 @@ class SkillValidator:
 
         return result
 
-    def _extract_code_blocks(self, content: str) -> list[tuple[str, str]]:
-        """Extract code blocks from markdown content."""
-        pattern = r"```(\w*)\n(.*?)```"
-        matches = re.findall(pattern, content, re.DOTALL)
-        return [(code.strip(), lang) for lang, code in matches]
-
-    def _check_syntax(self, code: str, block_num: int) -> list[Issue]:
+    def _check_syntax(self, error: SyntaxError | None, block_num: int) -> list[Issue]:
         """Check Python syntax validity."""
         issues = []
-        try:
-            ast.parse(code)
-        except SyntaxError as e:
+        if error is not None:
             issues.append(Issue(
                 level="error",
                 rule="syntax/invalid-python",
-                message=f"Invalid Python syntax: {e.msg}",
-                line=e.lineno,
+                message=f"Invalid Python syntax: {error.msg}",
+                line=error.lineno,
                 code_block=block_num,
             ))
         return issues
 
-    def _check_patterns(self, code: str, block_num: int) -> list[Issue]:
+    def _check_patterns(self, code: str, block_num: int, skip: bool = False) -> list[Issue]:
         """Check code against pattern rules."""
         issues = []
 
         # Skip blocks that are intentionally showing wrong examples
-        if re.search(r"#\s*(WRONG|BAD|DON'T|INCORRECT)", code, re.IGNORECASE):
+        if skip:
             return issues
 
         for rule in self.rules:
             # Check if pattern matches
-            if not re.search(rule["pattern"], code, re.MULTILINE):
+            match = rule["_pattern_re"].search(code)
+            if match is None:
                 continue
 
             # Check context requirement if present
             if "context" in rule:
-                if not re.search(rule["context"], code, re.IGNORECASE):
+                if not rule["_context_re"].search(code):
                     continue
 
             # Check negative pattern (should NOT be present)
             if "negative_pattern" in rule:
-                if re.search(rule["negative_pattern"], code, re.MULTILINE):
+                if rule["_negative_re"].search(code):
                     continue
 
-            # Find line number
-            line_num = None
-            for i, line in enumerate(code.split("\n"), 1):
-                if re.search(rule["pattern"], line):
-                    line_num = i
-                    break
-
             issues.append(Issue(
                 level=rule["level"],
                 rule=rule["id"],
                 message=rule["message"],
-                line=line_num,
+                line=_line_number(code, match),
                 code_block=block_num,
                 suggestion=rule.get("suggestion"),
             ))
@@ -249,20 +325,38 @@ class SkillValidator:
 
         return issues
 
-    def validate_all_skills(self, skills_dir: Path) -> list[ValidationResult]:
-        """Validate all skills in a directory."""
-        results = []
-        for skill_path in skills_dir.glob("*/SKILL.md"):
-            results.append(self.validate_skill(skill_path))
-        return results
+    def validate_all_skills(self, skills_dir: Path, max_workers: int | None = None) -> list[ValidationResult]:
+        """Validate all skills in a directory.
+
+        Skills are validated sequentially unless max_workers > 1, in which
+        case they are spread across a process pool. Process start-up costs
+        more than validating a handful of skills, so only opt in for large
+        skill sets.
+        """
+        paths = []
+        with os.scandir(skills_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    skill_path = Path(entry.path) / "SKILL.md"
+                    if skill_path.exists():
+                        paths.append(skill_path)
+        if not max_workers or max_workers < 2 or len(paths) < 2:
+            return [self.validate_skill(skill_path) for skill_path in paths]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Workers receive this validator via the bound method, so custom
+        # rules and subclasses are honoured
+        with ProcessPoolExecutor(max_workers=min(len(paths), max_workers)) as executor:
+            return list(executor.map(self.validate_skill, paths))
 
 
 def format_result(result: ValidationResult) -> str:
     """Format validation result as readable output."""
     lines = [
-        f"\n{'='*60}",
+        f"\n{SEP60}",
         f"Skill: {result.skill_name}",
-        f"{'='*60}",
+        SEP60,
         f"Code blocks checked: {result.code_blocks_checked}",
     ]
 